@@ -4,22 +4,283 @@ Memo CRUD Operations
 メモのCRUD操作とJSONファイル管理
 """
 
+import atexit
+import bisect
+import heapq
 import json
+import mmap
 import os
+import threading
 import uuid
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
-# メモデータファイルのパス
-MEMOS_FILE = os.path.join(os.path.dirname(__file__), "memos.json")
+try:
+    import orjson
+except ImportError:
+    # orjsonが無い環境では標準ライブラリのjsonにフォールバック
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasickが無い環境ではキーワードごとのbytes.find走査にフォールバック
+    ahocorasick = None
+
+# メモデータファイルのパス（JSON Lines形式: 1行1メモ）
+MEMOS_FILE = os.path.join(os.path.dirname(__file__), "memos.jsonl")
+
+# 旧形式（単一JSON配列）のファイルパス。存在すれば初回読み込み時にJSONLへ移行する
+_LEGACY_MEMOS_FILE = os.path.join(os.path.dirname(__file__), "memos.json")
+
+# このサイズ以上のファイルはmmap経由で読む（小さいファイルではシステムコールの方が高くつく）
+_MMAP_THRESHOLD = 1024 * 1024
+
+# ダーティなキャッシュをディスクへ書き出すまでの猶予（秒）。
+# この間に続いた変更は1回の書き込みにまとめられる
+_FLUSH_INTERVAL = 5.0
+
+# 遅延フラッシュ用のタイマーとその排他ロック
+_flush_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+# 重要度ソート用のキー関数（C実装のitemgetterでlambdaの呼び出しコストを省く。
+# importanceキーは読み込み時に補完されるため常に存在する）
+_IMPORTANCE_KEY = itemgetter("importance")
+
+# パース済みメモのプロセス内キャッシュ（mtimeでファイル更新を検知して無効化する）
+# by_id: メモIDからメモ本体へのインデックス（リストとオブジェクトを共有する）
+# tag_index / context_index: タグ・文脈からメモID集合への転置インデックス
+# related_back: メモIDから、それをrelated_toで参照しているメモID集合への逆参照インデックス
+# search_blob / search_offsets / search_ids: 全メモの検索ブロブを1本のバイト列に
+# 詰め込んだもの。offsetsは各メモの開始位置、idsは位置に対応するメモID
+# blob_cache: メモIDごとの小文字化済みブロブ。内容が変わったメモの分だけ作り直す
+# emotion_counts / importance_dist: 統計情報用の集計（get_memo_statsが走査なしで返せる）
+# search_text / search_text_offsets: Aho-Corasick走査用のstr版連結ブロブと文字オフセット
+# （pyahocorasickのビルドはstrしか受け取れないため、bytes版とは別に持つ）
+# sorted_tags / sorted_contexts / sorted_emotions: 統計用のソート済み一覧。
+# 書き込み時に確定させ、get_memo_statsの読み取りパスからソートを無くす
+_CACHE: Dict[str, Any] = {
+    "mtime": 0,
+    "data": None,
+    "by_id": {},
+    "tag_index": defaultdict(set),
+    "context_index": defaultdict(set),
+    "related_back": defaultdict(set),
+    "search_blob": b"",
+    "search_offsets": [],
+    "search_ids": [],
+    "search_text": "",
+    "search_text_offsets": [],
+    "blob_cache": {},
+    "emotion_counts": Counter(),
+    "importance_dist": Counter(),
+    "sorted_tags": [],
+    "sorted_contexts": [],
+    "sorted_emotions": [],
+    "dirty": False,
+}
+
+def _search_blob(memo: Dict[str, Any]) -> bytes:
+    """
+    検索対象フィールドを1本に連結した小文字のブロブを作る
+
+    内容・タグ・文脈・感情をUS制御文字(0x1f)区切りで連結することで、
+    メモ1件あたりの照合が4回の部分一致判定から1回で済む。
+    クエリに区切り文字は現れないため、フィールド境界をまたぐ誤マッチは起きない
+
+    Args:
+        memo: 対象のメモ
+
+    Returns:
+        小文字化しUTF-8エンコードした連結ブロブ
+    """
+    parts = [memo.get("content", "")]
+    parts.extend(memo.get("tags", []))
+    if memo.get("context"):
+        parts.append(memo["context"])
+    if memo.get("emotion"):
+        parts.append(memo["emotion"])
+    return "\x1f".join(parts).lower().encode('utf-8')
+
+def _rebuild_indexes(memos: List[Dict[str, Any]]) -> None:
+    """
+    キャッシュ上のインデックスをメモ一覧から構築し直す
+
+    Args:
+        memos: インデックス構築対象のメモのリスト
+    """
+    by_id: Dict[str, Dict[str, Any]] = {}
+    tag_index: defaultdict = defaultdict(set)
+    context_index: defaultdict = defaultdict(set)
+    related_back: defaultdict = defaultdict(set)
+    emotion_counts: Counter = Counter()
+    importance_dist: Counter = Counter()
+
+    for memo in memos:
+        memo_id = memo["id"]
+        by_id[memo_id] = memo
+        for tag in memo.get("tags", []):
+            tag_index[tag].add(memo_id)
+        if memo.get("context"):
+            context_index[memo["context"]].add(memo_id)
+        for related_id in memo.get("related_to", []):
+            related_back[related_id].add(memo_id)
+        if memo.get("emotion"):
+            emotion_counts[memo["emotion"]] += 1
+        importance_dist[memo.get("importance", 1)] += 1
+
+    _CACHE["by_id"] = by_id
+    _CACHE["tag_index"] = tag_index
+    _CACHE["context_index"] = context_index
+    _CACHE["related_back"] = related_back
+    _CACHE["emotion_counts"] = emotion_counts
+    _CACHE["importance_dist"] = importance_dist
+
+    # 統計用のソート済み一覧は書き込み時に確定させておく
+    _CACHE["sorted_tags"] = sorted(tag_index)
+    _CACHE["sorted_contexts"] = sorted(context_index)
+    _CACHE["sorted_emotions"] = sorted(emotion_counts)
+
+    # 全メモのブロブを1本のバイト列に詰め込み、開始オフセットを別配列に持つ。
+    # 検索はC実装のbytes.findによる1回の走査で全メモを舐められる。
+    # 各メモのブロブは書き込み時に作られたものを再利用し、小文字化や連結は
+    # 内容が変わったメモの分だけやり直す
+    blob_cache = _CACHE["blob_cache"]
+    search_ids = []
+    blobs = []
+    offsets = []
+    pos = 0
+    for memo in memos:
+        memo_id = memo["id"]
+        blob = blob_cache.get(memo_id)
+        if blob is None:
+            blob = _search_blob(memo)
+            blob_cache[memo_id] = blob
+        search_ids.append(memo_id)
+        blobs.append(blob)
+        offsets.append(pos)
+        pos += len(blob) + 1  # 区切り文字の分
+
+    # 削除済みメモの分をブロブキャッシュから掃除する
+    if len(blob_cache) > len(by_id):
+        for cached_id in list(blob_cache):
+            if cached_id not in by_id:
+                del blob_cache[cached_id]
+
+    _CACHE["search_blob"] = b"\x1f".join(blobs)
+    _CACHE["search_offsets"] = offsets
+    _CACHE["search_ids"] = search_ids
+
+    if ahocorasick is not None:
+        # Aho-Corasick走査用にstr版の連結ブロブと文字単位のオフセットも持つ
+        text_parts = [blob.decode('utf-8') for blob in blobs]
+        text_offsets = []
+        text_pos = 0
+        for part in text_parts:
+            text_offsets.append(text_pos)
+            text_pos += len(part) + 1  # 区切り文字の分
+        _CACHE["search_text"] = "\x1f".join(text_parts)
+        _CACHE["search_text_offsets"] = text_offsets
+
+def _dumps_memo(memo: Dict[str, Any]) -> bytes:
+    """
+    単一メモをJSONLの1行分のバイト列にシリアライズする
+
+    Args:
+        memo: シリアライズするメモ
+
+    Returns:
+        UTF-8エンコードされたJSONバイト列（改行なし）
+    """
+    if orjson is not None:
+        return orjson.dumps(memo, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(memo, ensure_ascii=False).encode('utf-8')
+
+def _loads_memo(line: bytes) -> Dict[str, Any]:
+    """
+    JSONLの1行分のバイト列から単一メモをデシリアライズする
+
+    Args:
+        line: UTF-8エンコードされたJSONバイト列
+
+    Returns:
+        メモの辞書
+    """
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+def _dumps(memos: List[Dict[str, Any]]) -> bytes:
+    """
+    メモのリストをJSONLバイト列（1行1メモ）にシリアライズする
+
+    Args:
+        memos: シリアライズするメモのリスト
+
+    Returns:
+        UTF-8エンコードされたJSONLバイト列
+    """
+    return b"".join(_dumps_memo(memo) + b"\n" for memo in memos)
+
+def _loads(data: bytes) -> List[Dict[str, Any]]:
+    """
+    JSONLバイト列からメモのリストをデシリアライズする
+
+    Args:
+        data: UTF-8エンコードされたJSONLバイト列
+
+    Returns:
+        メモのリスト
+    """
+    return _loads_lines(data.splitlines())
+
+def _loads_lines(lines) -> List[Dict[str, Any]]:
+    """
+    JSONLの行イテレータからメモのリストをデシリアライズする
+
+    Args:
+        lines: UTF-8エンコードされたJSON行を返すイテラブル
+
+    Returns:
+        メモのリスト
+    """
+    memos = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            memo = _loads_memo(line)
+        except ValueError:
+            # 書きかけで途切れた行（クラッシュ時など）は読み飛ばす
+            continue
+        # 手編集などでimportanceが欠けていても並べ替えキーとして使えるよう補完する
+        memo.setdefault("importance", 1)
+        memos.append(memo)
+    return memos
 
 def _ensure_memos_file() -> None:
     """
-    memos.jsonファイルが存在しなければ空の配列で初期化する
+    memos.jsonlファイルが存在しなければ初期化する
+
+    旧形式のmemos.json（単一JSON配列）が残っていれば内容を引き継いで移行する
     """
-    if not os.path.exists(MEMOS_FILE):
-        with open(MEMOS_FILE, 'w', encoding='utf-8') as f:
-            json.dump([], f, ensure_ascii=False, indent=2)
+    if os.path.exists(MEMOS_FILE):
+        return
+
+    legacy_memos: List[Dict[str, Any]] = []
+    if os.path.exists(_LEGACY_MEMOS_FILE):
+        try:
+            with open(_LEGACY_MEMOS_FILE, 'rb') as f:
+                raw = f.read()
+            legacy_memos = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (ValueError, OSError):
+            legacy_memos = []
+
+    with open(MEMOS_FILE, 'wb') as f:
+        f.write(_dumps(legacy_memos))
 
 def _load_memos() -> List[Dict[str, Any]]:
     """
@@ -28,23 +289,119 @@ def _load_memos() -> List[Dict[str, Any]]:
     Returns:
         メモのリスト
     """
+    # 未フラッシュの変更がある間はキャッシュが正（ディスクの方が古い）
+    if _CACHE["dirty"] and _CACHE["data"] is not None:
+        return _CACHE["data"]
+
     _ensure_memos_file()
     try:
-        with open(MEMOS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        # ファイルが破損している場合は空のリストを返す
-        return []
+        # ファイルが前回読み込みから変わっていなければキャッシュをそのまま返す
+        stat = os.stat(MEMOS_FILE)
+        mtime = stat.st_mtime_ns
+        if _CACHE["data"] is not None and _CACHE["mtime"] == mtime:
+            return _CACHE["data"]
+
+        # orjsonはバイト列を直接受け取れるためバイナリモードで読む
+        if stat.st_size >= _MMAP_THRESHOLD:
+            # 大きいファイルは全体を一度にコピーせず、mmap経由で1行ずつ読む
+            with open(MEMOS_FILE, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                memos = _loads_lines(iter(mm.readline, b""))
+        else:
+            with open(MEMOS_FILE, 'rb') as f:
+                memos = _loads(f.read())
+    except (ValueError, FileNotFoundError, OSError):
+        # ファイルが破損している場合は空のリストとして扱う
+        # （json.JSONDecodeError / orjson.JSONDecodeErrorはいずれもValueErrorの派生）
+        memos = []
+        mtime = 0
+
+    _CACHE["data"] = memos
+    _CACHE["mtime"] = mtime
+    # ディスクから読み直した場合は既存ブロブを信用しない（外部で書き換えられた可能性がある）
+    _CACHE["blob_cache"].clear()
+    _rebuild_indexes(memos)
+    return memos
 
 def _save_memos(memos: List[Dict[str, Any]]) -> None:
     """
     メモデータをJSONファイルに保存する
-    
+
+    一時ファイルに書き込んでからos.replaceで差し替えることで、
+    書き込み途中のクラッシュでも既存ファイルが壊れないようにする
+
     Args:
         memos: 保存するメモのリスト
     """
-    with open(MEMOS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(memos, f, ensure_ascii=False, indent=2)
+    tmp_file = MEMOS_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(_dumps(memos))
+        f.flush()
+        os.fsync(f.fileno())
+
+    # os.replaceはPOSIX/Windowsいずれでもアトミック
+    os.replace(tmp_file, MEMOS_FILE)
+
+    # 書き込んだ内容をそのままキャッシュに反映し、次回の再パースを省く
+    _CACHE["data"] = memos
+    _CACHE["mtime"] = os.stat(MEMOS_FILE).st_mtime_ns
+    _rebuild_indexes(memos)
+
+def _append_memo(memo: Dict[str, Any]) -> None:
+    """
+    単一メモをJSONLファイルの末尾に追記する
+
+    既存データを書き直さないため、メモ作成はO(1)の追記で済む。
+    呼び出し側でキャッシュ上のリストに追加済みであることを前提とする
+
+    Args:
+        memo: 追記するメモ
+    """
+    _ensure_memos_file()
+    with open(MEMOS_FILE, 'ab') as f:
+        f.write(_dumps_memo(memo) + b"\n")
+
+    _CACHE["mtime"] = os.stat(MEMOS_FILE).st_mtime_ns
+    _rebuild_indexes(_CACHE["data"])
+
+def _mark_dirty() -> None:
+    """
+    キャッシュ上の変更をダーティとして記録し、遅延フラッシュを予約する
+
+    連続する変更は_FLUSH_INTERVAL秒の猶予内で1回のディスク書き込みにまとめられる
+    """
+    global _flush_timer
+
+    _rebuild_indexes(_CACHE["data"])
+    _CACHE["dirty"] = True
+
+    with _flush_lock:
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_INTERVAL, flush)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+def flush() -> None:
+    """
+    未書き込みのキャッシュ内容をディスクへ書き出す
+
+    ダーティでなければ何もしない。プロセス終了時にも自動で呼ばれる
+    """
+    global _flush_timer
+
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+
+    if _CACHE["dirty"] and _CACHE["data"] is not None:
+        # 書き込みが成功してからダーティを解除する
+        # （失敗時はダーティのまま残し、次回のフラッシュで再試行できるようにする）
+        _save_memos(_CACHE["data"])
+        _CACHE["dirty"] = False
+
+# プロセス終了時に未フラッシュの変更を失わないようにする
+atexit.register(flush)
 
 def _generate_id() -> str:
     """
@@ -107,13 +464,15 @@ def create_memo(
         ValueError: 無効なデータの場合
     """
     _validate_memo_data(content, importance)
-    
+
+    # 作成日時と更新日時は同一時刻なので1回だけ取得する
+    timestamp = _get_current_timestamp()
     memo = {
         "id": _generate_id(),
         "content": content.strip(),
         "tags": tags or [],
-        "created_at": _get_current_timestamp(),
-        "updated_at": _get_current_timestamp(),
+        "created_at": timestamp,
+        "updated_at": timestamp,
         "importance": importance,
         "emotion": emotion,
         "related_to": related_to or [],
@@ -122,8 +481,13 @@ def create_memo(
     
     memos = _load_memos()
     memos.append(memo)
-    _save_memos(memos)
-    
+    if _CACHE["dirty"]:
+        # 未フラッシュの変更があれば、まとめて次回のフラッシュで書き出す
+        _mark_dirty()
+    else:
+        # 作成は全体の書き直しではなく追記のみ
+        _append_memo(memo)
+
     return memo
 
 def get_all_memos() -> List[Dict[str, Any]]:
@@ -145,11 +509,8 @@ def get_memo_by_id(memo_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         メモ（見つからない場合はNone）
     """
-    memos = _load_memos()
-    for memo in memos:
-        if memo["id"] == memo_id:
-            return memo
-    return None
+    _load_memos()
+    return _CACHE["by_id"].get(memo_id)
 
 def update_memo(
     memo_id: str,
@@ -179,36 +540,41 @@ def update_memo(
         ValueError: 無効なデータの場合
     """
     memos = _load_memos()
-    
-    for i, memo in enumerate(memos):
-        if memo["id"] == memo_id:
-            # 更新前の検証
-            new_content = content if content is not None else memo["content"]
-            new_importance = importance if importance is not None else memo["importance"]
-            _validate_memo_data(new_content, new_importance)
-            
-            # フィールドの更新
-            if content is not None:
-                memo["content"] = content.strip()
-            if tags is not None:
-                memo["tags"] = tags
-            if importance is not None:
-                memo["importance"] = importance
-            if emotion is not None:
-                memo["emotion"] = emotion
-            if context is not None:
-                memo["context"] = context
-            if related_to is not None:
-                memo["related_to"] = related_to
-            
-            # 更新日時を設定
-            memo["updated_at"] = _get_current_timestamp()
-            
-            memos[i] = memo
-            _save_memos(memos)
-            return memo
-    
-    return None
+
+    # インデックス経由でO(1)で取得（リストとオブジェクトを共有しているためその場で更新できる）
+    memo = _CACHE["by_id"].get(memo_id)
+    if memo is None:
+        return None
+
+    # 更新前の検証
+    new_content = content if content is not None else memo["content"]
+    new_importance = importance if importance is not None else memo["importance"]
+    _validate_memo_data(new_content, new_importance)
+
+    # フィールドの更新
+    if content is not None:
+        memo["content"] = content.strip()
+    if tags is not None:
+        memo["tags"] = tags
+    if importance is not None:
+        memo["importance"] = importance
+    if emotion is not None:
+        memo["emotion"] = emotion
+    if context is not None:
+        memo["context"] = context
+    if related_to is not None:
+        memo["related_to"] = related_to
+
+    # 検索対象フィールドが変わった場合のみブロブを作り直させる
+    if (content is not None or tags is not None
+            or emotion is not None or context is not None):
+        _CACHE["blob_cache"].pop(memo_id, None)
+
+    # 更新日時を設定
+    memo["updated_at"] = _get_current_timestamp()
+
+    _mark_dirty()
+    return memo
 
 def delete_memo(memo_id: str) -> bool:
     """
@@ -221,40 +587,106 @@ def delete_memo(memo_id: str) -> bool:
         削除に成功した場合True、メモが見つからない場合False
     """
     memos = _load_memos()
-    
-    for i, memo in enumerate(memos):
-        if memo["id"] == memo_id:
-            # 関連メモから削除対象のIDを除去
-            _remove_related_references(memos, memo_id)
-            
-            # メモを削除
-            del memos[i]
-            _save_memos(memos)
-            return True
-    
-    return False
 
-def _remove_related_references(memos: List[Dict[str, Any]], deleted_id: str) -> None:
+    memo = _CACHE["by_id"].pop(memo_id, None)
+    if memo is None:
+        return False
+
+    # 関連メモから削除対象のIDを除去
+    _remove_related_references(memo_id)
+
+    # メモを削除（リストからの除去のみO(n)）
+    memos.remove(memo)
+    _mark_dirty()
+    return True
+
+def _remove_related_references(deleted_id: str) -> None:
     """
     削除されるメモへの参照を他のメモから除去する
-    
+
+    逆参照インデックス経由で実際に参照しているメモだけを処理するため、
+    全メモの走査は発生しない
+
     Args:
-        memos: メモのリスト
         deleted_id: 削除されるメモのID
     """
-    for memo in memos:
-        if "related_to" in memo and deleted_id in memo["related_to"]:
-            memo["related_to"].remove(deleted_id)
-            memo["updated_at"] = _get_current_timestamp()
+    by_id = _CACHE["by_id"]
+    timestamp = _get_current_timestamp()
+    for referrer_id in _CACHE["related_back"].pop(deleted_id, ()):
+        referrer = by_id.get(referrer_id)
+        if referrer is not None and deleted_id in referrer.get("related_to", []):
+            referrer["related_to"].remove(deleted_id)
+            referrer["updated_at"] = timestamp
+
+def _scan_blob(term: bytes) -> set:
+    """
+    連結ブロブをbytes.findで1回走査し、キーワードを含むメモを探す
+
+    Args:
+        term: 小文字化・UTF-8エンコード済みのキーワード
+
+    Returns:
+        ヒットしたメモのスロット番号の集合
+    """
+    blob = _CACHE["search_blob"]
+    offsets = _CACHE["search_offsets"]
+    total = len(offsets)
+    hit_indexes = set()
+
+    pos = blob.find(term)
+    while pos != -1:
+        index = bisect.bisect_right(offsets, pos) - 1
+        hit_indexes.add(index)
+
+        # 同一メモ内の重複ヒットを飛ばし、次のメモ領域から走査を再開する
+        if index + 1 >= total:
+            break
+        pos = blob.find(term, offsets[index + 1])
+
+    return hit_indexes
+
+def _scan_multi_terms(terms: List[str]) -> set:
+    """
+    複数キーワードをOR条件で走査する
+
+    pyahocorasickがあればオートマトンによる1回の走査で全キーワードを照合し、
+    なければキーワードごとにbytes.find走査して和集合を取る
+
+    Args:
+        terms: 小文字化済みのキーワードのリスト
+
+    Returns:
+        いずれかのキーワードを含むメモのスロット番号の集合
+    """
+    unique_terms = set(terms)
+    if ahocorasick is None:
+        hit_indexes = set()
+        for term in unique_terms:
+            hit_indexes |= _scan_blob(term.encode('utf-8'))
+        return hit_indexes
+
+    automaton = ahocorasick.Automaton()
+    for term in unique_terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+
+    offsets = _CACHE["search_text_offsets"]
+    hit_indexes = set()
+    for end_pos, _term in automaton.iter(_CACHE["search_text"]):
+        # マッチは区切り文字をまたがないため、終端位置だけでメモを特定できる
+        hit_indexes.add(bisect.bisect_right(offsets, end_pos) - 1)
+    return hit_indexes
 
 def search_memos(query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     メモの内容、タグ、文脈から検索する
-    
+
+    空白区切りで複数キーワードを指定した場合は、いずれかを含むメモがヒットする（OR検索）
+
     Args:
         query: 検索クエリ
         limit: 取得件数の上限
-    
+
     Returns:
         検索にマッチしたメモのリスト（重要度順）
     """
@@ -262,37 +694,25 @@ def search_memos(query: str, limit: Optional[int] = None) -> List[Dict[str, Any]
         return []
     
     query_lower = query.strip().lower()
-    memos = _load_memos()
-    matching_memos = []
-    
-    for memo in memos:
-        # 内容での検索
-        if query_lower in memo.get("content", "").lower():
-            matching_memos.append(memo)
-            continue
-        
-        # タグでの検索
-        if any(query_lower in tag.lower() for tag in memo.get("tags", [])):
-            matching_memos.append(memo)
-            continue
-        
-        # 文脈での検索
-        if memo.get("context") and query_lower in memo["context"].lower():
-            matching_memos.append(memo)
-            continue
-        
-        # 感情での検索
-        if memo.get("emotion") and query_lower in memo["emotion"].lower():
-            matching_memos.append(memo)
-            continue
-    
-    # 重要度順にソート（高い順）
-    matching_memos.sort(key=lambda x: x.get("importance", 1), reverse=True)
+    _load_memos()
+    by_id = _CACHE["by_id"]
+    search_ids = _CACHE["search_ids"]
+
+    # 空白区切りの複数キーワードはOR条件（いずれかを含むメモがヒット）
+    terms = query_lower.split()
+    if len(terms) > 1:
+        hit_indexes = _scan_multi_terms(terms)
+    else:
+        hit_indexes = _scan_blob(terms[0].encode('utf-8'))
+
+    matching_memos = [by_id[search_ids[index]] for index in sorted(hit_indexes)]
     
-    # 件数制限
+    # 件数制限がある場合は全ソートせずヒープで上位だけ取り出す
     if limit:
-        matching_memos = matching_memos[:limit]
-    
+        return heapq.nlargest(limit, matching_memos, key=_IMPORTANCE_KEY)
+
+    # 重要度順にソート（高い順）
+    matching_memos.sort(key=_IMPORTANCE_KEY, reverse=True)
     return matching_memos
 
 def get_memos_by_tags(tags: List[str]) -> List[Dict[str, Any]]:
@@ -307,17 +727,38 @@ def get_memos_by_tags(tags: List[str]) -> List[Dict[str, Any]]:
     """
     if not tags:
         return []
-    
-    memos = _load_memos()
-    matching_memos = []
-    
-    for memo in memos:
-        memo_tags = memo.get("tags", [])
-        if any(tag in memo_tags for tag in tags):
-            matching_memos.append(memo)
-    
+
+    _load_memos()
+    tag_index = _CACHE["tag_index"]
+    by_id = _CACHE["by_id"]
+
+    # 転置インデックスのID集合を合併してからメモ本体を引く
+    matching_ids = set().union(*(tag_index.get(tag, ()) for tag in tags))
+    matching_memos = [by_id[memo_id] for memo_id in matching_ids]
+
     # 重要度順にソート
-    matching_memos.sort(key=lambda x: x.get("importance", 1), reverse=True)
+    matching_memos.sort(key=_IMPORTANCE_KEY, reverse=True)
+    return matching_memos
+
+def get_memos_by_context(context: str) -> List[Dict[str, Any]]:
+    """
+    指定された文脈を持つメモを取得する
+
+    Args:
+        context: 検索対象の文脈
+
+    Returns:
+        マッチしたメモのリスト
+    """
+    if not context:
+        return []
+
+    _load_memos()
+    by_id = _CACHE["by_id"]
+    matching_memos = [by_id[memo_id] for memo_id in _CACHE["context_index"].get(context, ())]
+
+    # 重要度順にソート
+    matching_memos.sort(key=_IMPORTANCE_KEY, reverse=True)
     return matching_memos
 
 def get_memo_stats() -> Dict[str, Any]:
@@ -328,7 +769,7 @@ def get_memo_stats() -> Dict[str, Any]:
         統計情報の辞書
     """
     memos = _load_memos()
-    
+
     if not memos:
         return {
             "total_count": 0,
@@ -337,27 +778,16 @@ def get_memo_stats() -> Dict[str, Any]:
             "emotions": [],
             "importance_distribution": {}
         }
-    
-    # タグの集計
-    all_tags = set()
-    contexts = set()
-    emotions = set()
-    importance_dist = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    
-    for memo in memos:
-        all_tags.update(memo.get("tags", []))
-        if memo.get("context"):
-            contexts.add(memo["context"])
-        if memo.get("emotion"):
-            emotions.add(memo["emotion"])
-        importance_dist[memo.get("importance", 1)] += 1
-    
+
+    # 集計もソートもキャッシュのインデックス構築時に済んでいるため、読み取りはコピーのみ
+    importance_dist = _CACHE["importance_dist"]
+
     return {
         "total_count": len(memos),
-        "tags_count": len(all_tags),
-        "unique_tags": sorted(list(all_tags)),
-        "contexts": sorted(list(contexts)),
-        "emotions": sorted(list(emotions)),
-        "importance_distribution": importance_dist
+        "tags_count": len(_CACHE["sorted_tags"]),
+        "unique_tags": list(_CACHE["sorted_tags"]),
+        "contexts": list(_CACHE["sorted_contexts"]),
+        "emotions": list(_CACHE["sorted_emotions"]),
+        "importance_distribution": {i: importance_dist.get(i, 0) for i in range(1, 6)}
     }
     
\ No newline at end of file
@@ -4,22 +4,47 @@ MCP Memory Server - メモ管理MCPサーバ
 FastMCPを使用してメモのCRUD操作を提供
 """
 
-import asyncio
-import json
+import heapq
+import re
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP
 from crud import (
     create_memo,
     get_all_memos,
     get_memo_by_id,
+    get_memos_by_tags,
+    get_memos_by_context,
     update_memo,
     delete_memo,
-    search_memos
+    search_memos,
+    flush
 )
 
 # MCPサーバの初期化
 mcp = FastMCP("Memory Server")
 
+# カンマ区切り要素（前後の空白を除いたもの）にマッチするパターン
+_TAG_RE = re.compile(r'[^,\s][^,]*[^,\s]|[^,\s]')
+
+# 重要度ソート用のキー関数（C実装のitemgetterでlambdaの呼び出しコストを省く）
+_IMPORTANCE_KEY = itemgetter("importance")
+
+def _parse_tags(tags_str: Optional[str]) -> List[str]:
+    """
+    カンマ区切りのタグ文字列をタグのリストに変換する
+
+    Args:
+        tags_str: カンマ区切りのタグ文字列
+
+    Returns:
+        前後の空白を除いたタグのリスト（入力が空の場合は空リスト）
+    """
+    if not tags_str:
+        return []
+    # コンパイル済み正規表現の1パスでsplit+strip+フィルタを済ませる
+    return _TAG_RE.findall(tags_str)
+
 @mcp.tool()
 def create_new_memo(
     content: str,
@@ -43,13 +68,11 @@ def create_new_memo(
     """
     try:
         # タグの処理（カンマ区切りの文字列を想定）
-        tags = None
-        if tags_str and tags_str.strip():
-            tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-        
+        tags = _parse_tags(tags_str)
+
         memo = create_memo(
             content=content,
-            tags=tags or [],
+            tags=tags,
             importance=max(1, min(5, importance)),  # 1-5の範囲に制限
             emotion=emotion,
             context=context
@@ -91,28 +114,27 @@ def get_memos(
         importance_min = int(importance_min_str) if importance_min_str and importance_min_str.strip() else None
         
         # タグの処理（カンマ区切りの文字列を想定）
-        tags = None
-        if tags_str and tags_str.strip():
-            tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
+        tags = _parse_tags(tags_str)
 
-        memos = get_all_memos()
-        
-        # フィルタリング
+        # タグ・文脈は転置インデックス経由で絞り込む
         if tags:
-            memos = [memo for memo in memos if any(tag in memo.get('tags', []) for tag in tags)]
-        
+            memos = get_memos_by_tags(tags)
+            if context:
+                memos = [memo for memo in memos if memo.get('context') == context]
+        elif context:
+            memos = get_memos_by_context(context)
+        else:
+            # キャッシュされたリストをその場でソートしないようコピーする
+            memos = list(get_all_memos())
+
         if importance_min:
             memos = [memo for memo in memos if memo.get('importance', 1) >= importance_min]
         
-        if context:
-            memos = [memo for memo in memos if memo.get('context') == context]
-        
-        # 重要度順にソート（高い順）
-        memos.sort(key=lambda x: x.get('importance', 1), reverse=True)
-        
-        # 件数制限
+        # 重要度順に並べる（件数制限がある場合は全ソートせずヒープで上位だけ取り出す）
         if limit:
-            memos = memos[:limit]
+            memos = heapq.nlargest(limit, memos, key=_IMPORTANCE_KEY)
+        else:
+            memos.sort(key=_IMPORTANCE_KEY, reverse=True)
         
         return {
             "success": True,
@@ -187,14 +209,9 @@ def update_existing_memo(
         # 安全な型変換
         importance = int(importance_str) if importance_str and importance_str.strip() else None
         
-        # タグの処理（カンマ区切りの文字列を想定）
-        tags = None
-        if tags_str and tags_str.strip():
-            tags = [tag.strip() for tag in tags_str.split(',') if tag.strip()]
-
-        relations = None
-        if related_to_str and related_to_str.strip():
-            relations = [relation.strip() for relation in related_to_str.split(',') if relation.strip()]
+        # タグ・関連IDの処理（いずれもカンマ区切りの文字列を想定）。空ならNone（＝更新しない）
+        tags = _parse_tags(tags_str) or None
+        relations = _parse_tags(related_to_str) or None
 
         # 重要度の範囲チェック
         if importance is not None:
@@ -265,11 +282,14 @@ def search_memo_content(
 ) -> Dict[str, Any]:
     """
     メモの内容を検索する
-    
+
+    空白区切りで複数キーワードを指定した場合は、いずれかを含むメモがヒットする（OR検索）。
+    空白を含むフレーズをそのまま部分一致させることはできない
+
     Args:
-        query: 検索クエリ
+        query: 検索クエリ（空白区切りで複数キーワードを指定可能）
         limit_num: 取得件数の上限
-    
+
     Returns:
         検索結果のメモリスト
     """
@@ -291,6 +311,29 @@ def search_memo_content(
             "message": "検索に失敗しました"
         }
 
+@mcp.tool()
+def flush_memos() -> Dict[str, Any]:
+    """
+    未保存のメモ変更をディスクに書き出す
+
+    変更は通常数秒以内に自動保存されるが、即時の永続化が必要な場合に呼び出す
+
+    Returns:
+        書き出し結果
+    """
+    try:
+        flush()
+        return {
+            "success": True,
+            "message": "メモをディスクに保存しました"
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "メモの保存に失敗しました"
+        }
+
 if __name__ == "__main__":
     # サーバーを起動
     mcp.run(transport='stdio')